@@ -3,37 +3,31 @@ SQLite Database Setup Script for Event Planning System
 Creates tables and optionally seeds sample data
 """
 
-import sqlite3
-from pathlib import Path
-from typing import Optional
+from __future__ import annotations
 
+import csv
+import os
+import queue
+import sys
+import threading
+from contextlib import closing, contextmanager
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
 
-def create_database(db_path: str = "event_planning.db"):
-    """
-    Create the SQLite database with moderators and participants tables.
-    
-    Args:
-        db_path: Path to the database file
-    """
-    # Check if database already exists
-    db_file = Path(db_path)
-    if db_file.exists():
-        print(f"Database already exists at: {db_path}")
-        response = input("Do you want to recreate it? (yes/no): ").strip().lower()
-        if response != 'yes':
-            print("Keeping existing database.")
-            return
-        db_file.unlink()
-        print("Deleted existing database.")
-    
-    # Create connection
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    print(f"Creating database at: {db_path}")
-    
-    # Create moderators table
-    cursor.execute("""
+# sqlite3 is imported inside the functions that use it, so importing this
+# module (e.g. for the SQL constants) does not pay for loading it
+if TYPE_CHECKING:
+    import sqlite3
+
+# Rows per transaction for the bulk insert helpers
+BULK_BATCH_SIZE = 10000
+
+# (name, DDL) pairs for the schema. create_database always runs every
+# TABLE_DDL entry on a fresh file; create_indexes runs only the INDEX_DDL
+# entries missing from sqlite_master, so re-running it costs a single
+# catalog query
+TABLE_DDL = [
+    ("moderators", """
         CREATE TABLE IF NOT EXISTS moderators (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
@@ -44,11 +38,8 @@ def create_database(db_path: str = "event_planning.db"):
             expertise TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
-    """)
-    print("✓ Created 'moderators' table")
-    
-    # Create participants table
-    cursor.execute("""
+    """),
+    ("participants", """
         CREATE TABLE IF NOT EXISTS participants (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
@@ -58,50 +49,261 @@ def create_database(db_path: str = "event_planning.db"):
             phone TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
-    """)
-    print("✓ Created 'participants' table")
-    
-    # Create indexes for better query performance
-    cursor.execute("""
+    """),
+]
+
+# participants.email needs no explicit index: its UNIQUE constraint is
+# already backed by sqlite_autoindex_participants_1
+INDEX_DDL = [
+    ("idx_moderators_name", """
         CREATE INDEX IF NOT EXISTS idx_moderators_name 
         ON moderators(name)
-    """)
-    
-    cursor.execute("""
+    """),
+    ("idx_moderators_expertise", """
         CREATE INDEX IF NOT EXISTS idx_moderators_expertise 
         ON moderators(expertise)
-    """)
-    
-    cursor.execute("""
+    """),
+    ("idx_participants_name", """
         CREATE INDEX IF NOT EXISTS idx_participants_name 
         ON participants(name)
-    """)
+    """),
+]
+
+# Seed files read by seed_sample_data (header row, then one row per record)
+SAMPLE_MODERATORS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_moderators.csv")
+SAMPLE_PARTICIPANTS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_participants.csv")
+
+# Prepared statements kept per pooled connection. sqlite3 caches statements
+# by SQL text, so repeated execute() calls with the module-level SQL
+# constants below reuse the compiled statement instead of re-parsing it.
+STATEMENT_CACHE_SIZE = 256
+
+# Bytes of the database file memory-mapped by each pooled connection
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Separators and banners used by the console output
+_SEP_EQ = "=" * 60
+_SEP_DASH = "-" * 40
+_BANNER_MOD = f"\n{_SEP_EQ}\nMODERATORS TABLE\n{_SEP_EQ}"
+_BANNER_PART = f"\n{_SEP_EQ}\nPARTICIPANTS TABLE\n{_SEP_EQ}"
+
+# Rows formatted before each stdout write in view_database_contents
+_WRITE_BATCH = 1000
+
+INSERT_MODERATOR_SQL = """
+    INSERT INTO moderators (name, city, description, email, phone, expertise)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_PARTICIPANT_SQL = """
+    INSERT INTO participants (name, email, company, role, phone)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+
+class ConnectionPool:
+    """Thread-safe pool of reusable SQLite connections for one database file."""
+    
+    def __init__(self, db_path: str, pool_size: int = 5):
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self._pool: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=pool_size)
+        self._populate_pool()
+    
+    def _create_connection(self) -> sqlite3.Connection:
+        """Open a connection with the pragmas shared by every pooled handle."""
+        import sqlite3
+        
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=10000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Read pages straight from a 256 MB memory map instead of copying them
+        # into the page cache; safe on 64-bit systems, and WAL keeps readers
+        # from blocking writers.
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        return conn
+    
+    def _populate_pool(self):
+        for _ in range(self.pool_size):
+            self._pool.put(self._create_connection())
+    
+    @contextmanager
+    def get_connection(self):
+        """Check out a connection and return it to the pool when done."""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            # Never hand a connection with an open transaction to the next caller
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put(conn)
+    
+    def close_all(self):
+        """Close every connection currently held by the pool."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_POOLS: Dict[str, ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(db_path: str) -> ConnectionPool:
+    """Return the shared connection pool for db_path, creating it on first use."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(db_path)
+        if pool is None:
+            pool = _POOLS[db_path] = ConnectionPool(db_path)
+        return pool
+
+
+def _close_pool(db_path: str):
+    """Close and forget the pool for db_path (e.g. before deleting the file)."""
+    with _POOLS_LOCK:
+        pool = _POOLS.pop(db_path, None)
+    if pool is not None:
+        pool.close_all()
+
+
+def _existing_schema_names(conn: sqlite3.Connection) -> set:
+    """Return the names of all tables and indexes already in the database."""
+    return {
+        row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'index')"
+        )
+    }
+
+
+def create_database(
+    db_path: str = "event_planning.db",
+    include_indexes: bool = True,
+    force: bool = False,
+    verbose: bool = False
+):
+    """
+    Create the SQLite database with moderators and participants tables.
     
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_participants_email 
-        ON participants(email)
-    """)
-    print("✓ Created indexes")
+    Args:
+        db_path: Path to the database file
+        include_indexes: Build the secondary indexes as well. Pass False to
+            bulk-load data first and call create_indexes() afterwards.
+        force: Delete and recreate the database if it already exists
+        verbose: Print progress messages
+    
+    Raises:
+        FileExistsError: If the database exists and force is False
+    """
+    import sqlite3
+    
+    # Check if database already exists
+    if os.path.exists(db_path):
+        if not force:
+            raise FileExistsError(f"Database already exists at: {db_path}")
+        _close_pool(db_path)
+        os.unlink(db_path)
+        if verbose:
+            print("Deleted existing database.")
+    
+    if verbose:
+        print(f"Creating database at: {db_path}")
+    
+    # closing() guarantees the connection is closed; the inner "conn"
+    # commits on success and rolls back if any statement fails
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        cursor = conn.cursor()
+        
+        # page_size only takes effect before the first table is created (or via
+        # VACUUM), so it must be set here. WAL mode is persistent in the file.
+        cursor.execute("PRAGMA page_size=8192")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
+        # The file is always new here, so every table is created
+        for name, ddl in TABLE_DDL:
+            cursor.execute(ddl)
+            if verbose:
+                print(f"✓ Created '{name}' table")
+    
+    if include_indexes:
+        create_indexes(db_path, verbose=verbose)
+    
+    if verbose:
+        print(f"\n✅ Database created successfully at: {db_path}")
+
+
+def create_indexes(db_path: str = "event_planning.db", verbose: bool = False):
+    """
+    Create the secondary indexes on the moderators and participants tables.
+    
+    Building indexes after a bulk load is a single sorted pass per index,
+    which is cheaper than maintaining them row by row during the inserts.
+    
+    Args:
+        db_path: Path to the database file
+        verbose: Print progress messages
+    """
+    import sqlite3
     
-    conn.commit()
-    conn.close()
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        cursor = conn.cursor()
+        
+        # Create indexes for better query performance
+        existing = _existing_schema_names(conn)
+        for name, ddl in INDEX_DDL:
+            if name not in existing:
+                cursor.execute(ddl)
+        
+        # Drop the duplicate email index left behind by databases created
+        # with older versions
+        if "idx_participants_email" in existing:
+            cursor.execute("DROP INDEX idx_participants_email")
     
-    print(f"\n✅ Database created successfully at: {db_path}")
+    if verbose:
+        print("✓ Created indexes")
+
+
+def _executemany_csv(conn: sqlite3.Connection, sql: str, csv_path: str) -> int:
+    """Stream the rows of csv_path into sql in chunks of BULK_BATCH_SIZE."""
+    inserted = 0
+    with open(csv_path, newline="", encoding="utf-8") as csv_file:
+        reader = csv.reader(csv_file)
+        next(reader, None)  # skip header
+        # Empty cells are stored as NULL
+        rows = (tuple(value or None for value in row) for row in reader)
+        while True:
+            chunk = list(islice(rows, BULK_BATCH_SIZE))
+            if not chunk:
+                break
+            conn.executemany(sql, chunk)
+            inserted += len(chunk)
+    return inserted
 
 
 def seed_sample_data(db_path: str = "event_planning.db"):
     """
     Seed the database with sample moderators and participants.
     
+    Rows are read from sample_moderators.csv and sample_participants.csv
+    next to this script; the small built-in sample is used for any file
+    that is missing.
+    
     Args:
         db_path: Path to the database file
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    import sqlite3
     
     print("\nSeeding sample data...")
     
-    # Sample moderators
+    # Built-in sample moderators (used when the CSV is absent)
     sample_moderators = [
         ("Jai Kumar", "Hyderabad", "Experienced technical event moderator with 10+ years", 
          "jai.kumar@example.com", "+91-9876543210", "Technical, AI/ML, Cloud Computing"),
@@ -115,13 +317,7 @@ def seed_sample_data(db_path: str = "event_planning.db"):
          "vikram.singh@example.com", "+91-9876543214", "Cultural, Creative, Entertainment")
     ]
     
-    cursor.executemany("""
-        INSERT INTO moderators (name, city, description, email, phone, expertise)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, sample_moderators)
-    print(f"✓ Added {len(sample_moderators)} sample moderators")
-    
-    # Sample participants
+    # Built-in sample participants (used when the CSV is absent)
     sample_participants = [
         ("Alice Smith", "alice.smith@techcorp.com", "TechCorp", "Software Engineer", "+1-555-0101"),
         ("Bob Johnson", "bob.johnson@innovate.com", "Innovate Inc", "Product Manager", "+1-555-0102"),
@@ -135,65 +331,188 @@ def seed_sample_data(db_path: str = "event_planning.db"):
         ("Jack Anderson", "jack.anderson@digital.com", "Digital Corp", "Team Lead", "+1-555-0110")
     ]
     
-    cursor.executemany("""
-        INSERT INTO participants (name, email, company, role, phone)
-        VALUES (?, ?, ?, ?, ?)
-    """, sample_participants)
-    print(f"✓ Added {len(sample_participants)} sample participants")
-    
-    conn.commit()
-    conn.close()
+    # Insert both tables in a single transaction (one BEGIN/COMMIT pair).
+    # The built-in rows are loaded with one multi-row INSERT per table so
+    # SQLite parses the statement once; they stay far below the
+    # bound-parameter limit.
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        
+        if os.path.exists(SAMPLE_MODERATORS_CSV):
+            moderator_count = _executemany_csv(conn, INSERT_MODERATOR_SQL, SAMPLE_MODERATORS_CSV)
+        else:
+            placeholders = ",".join(["(?, ?, ?, ?, ?, ?)"] * len(sample_moderators))
+            conn.execute(f"""
+                INSERT INTO moderators (name, city, description, email, phone, expertise)
+                VALUES {placeholders}
+            """, tuple(chain.from_iterable(sample_moderators)))
+            moderator_count = len(sample_moderators)
+        
+        if os.path.exists(SAMPLE_PARTICIPANTS_CSV):
+            participant_count = _executemany_csv(conn, INSERT_PARTICIPANT_SQL, SAMPLE_PARTICIPANTS_CSV)
+        else:
+            placeholders = ",".join(["(?, ?, ?, ?, ?)"] * len(sample_participants))
+            conn.execute(f"""
+                INSERT INTO participants (name, email, company, role, phone)
+                VALUES {placeholders}
+            """, tuple(chain.from_iterable(sample_participants)))
+            participant_count = len(sample_participants)
+    
+    print(f"✓ Added {moderator_count} sample moderators")
+    print(f"✓ Added {participant_count} sample participants")
     
     print("\n✅ Sample data seeded successfully!")
 
 
-def view_database_contents(db_path: str = "event_planning.db"):
+def view_database_contents(
+    db_path: str = "event_planning.db",
+    limit: Optional[int] = None,
+    offset: int = 0
+):
     """
     Display the contents of the database.
     
     Args:
         db_path: Path to the database file
+        limit: Optional maximum number of rows to show per table
+        offset: Number of rows to skip per table (for paging)
     """
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    with _get_pool(db_path).get_connection() as conn:
+        _print_database_contents(conn, limit, offset)
+
+
+def _print_database_contents(
+    conn: sqlite3.Connection,
+    limit: Optional[int] = None,
+    offset: int = 0
+):
+    """Print both tables using an already open connection."""
+    import sqlite3
+    
+    # A dedicated cursor carries the Row factory and fetch size without
+    # changing the settings of the pooled connection itself
     cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    cursor.arraysize = 1000
+    # SQLite treats a negative LIMIT as "no limit"
+    page = (-1 if limit is None else limit, offset)
     
-    print("\n" + "="*60)
-    print("MODERATORS TABLE")
-    print("="*60)
-    cursor.execute("SELECT * FROM moderators")
-    moderators = cursor.fetchall()
-    
-    if moderators:
-        for mod in moderators:
-            print(f"\nID: {mod['id']}")
-            print(f"Name: {mod['name']}")
-            print(f"City: {mod['city']}")
-            print(f"Email: {mod['email']}")
-            print(f"Expertise: {mod['expertise']}")
-            print(f"Description: {mod['description']}")
-            print("-" * 40)
-    else:
+    print(_BANNER_MOD)
+    cursor.execute("""
+        SELECT id, name, city, email, expertise, description
+        FROM moderators
+        LIMIT ? OFFSET ?
+    """, page)
+    
+    # Iterate the cursor directly so rows are streamed, not materialized,
+    # and write the formatted rows to stdout in blocks of _WRITE_BATCH
+    any_row = False
+    parts = []
+    for mod in cursor:
+        any_row = True
+        parts.append(
+            f"\nID: {mod['id']}\n"
+            f"Name: {mod['name']}\n"
+            f"City: {mod['city']}\n"
+            f"Email: {mod['email']}\n"
+            f"Expertise: {mod['expertise']}\n"
+            f"Description: {mod['description']}\n"
+            f"{_SEP_DASH}\n"
+        )
+        if len(parts) >= _WRITE_BATCH:
+            sys.stdout.write("".join(parts))
+            parts.clear()
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
+    if not any_row:
         print("No moderators found.")
     
-    print("\n" + "="*60)
-    print("PARTICIPANTS TABLE")
-    print("="*60)
-    cursor.execute("SELECT * FROM participants")
-    participants = cursor.fetchall()
-    
-    if participants:
-        for part in participants:
-            print(f"\nID: {part['id']}")
-            print(f"Name: {part['name']}")
-            print(f"Email: {part['email']}")
-            print(f"Company: {part['company']}")
-            print(f"Role: {part['role']}")
-            print("-" * 40)
-    else:
+    print(_BANNER_PART)
+    cursor.execute("""
+        SELECT id, name, email, company, role
+        FROM participants
+        LIMIT ? OFFSET ?
+    """, page)
+    
+    any_row = False
+    parts = []
+    for part in cursor:
+        any_row = True
+        parts.append(
+            f"\nID: {part['id']}\n"
+            f"Name: {part['name']}\n"
+            f"Email: {part['email']}\n"
+            f"Company: {part['company']}\n"
+            f"Role: {part['role']}\n"
+            f"{_SEP_DASH}\n"
+        )
+        if len(parts) >= _WRITE_BATCH:
+            sys.stdout.write("".join(parts))
+            parts.clear()
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
+    if not any_row:
         print("No participants found.")
+
+
+def _insert_bulk(db_path: str, sql: str, rows: Iterable[Tuple], batch_size: int) -> int:
+    """Insert rows in chunks of batch_size, one transaction per chunk."""
+    inserted = 0
+    rows = iter(rows)
+    with _get_pool(db_path).get_connection() as conn:
+        while True:
+            chunk = list(islice(rows, batch_size))
+            if not chunk:
+                break
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(sql, chunk)
+            inserted += len(chunk)
+    return inserted
+
+
+def add_moderators_bulk(
+    db_path: str,
+    rows: Iterable[Tuple],
+    batch_size: int = BULK_BATCH_SIZE
+) -> int:
+    """
+    Add many moderators to the database.
+    
+    Args:
+        db_path: Path to the database file
+        rows: Iterable of (name, city, description, email, phone, expertise) tuples
+        batch_size: Number of rows committed per transaction
+    
+    Returns:
+        Number of moderators inserted
+    """
+    return _insert_bulk(db_path, INSERT_MODERATOR_SQL, rows, batch_size)
+
+
+def add_participants_bulk(
+    db_path: str,
+    rows: Iterable[Tuple],
+    batch_size: int = BULK_BATCH_SIZE
+) -> int:
+    """
+    Add many participants to the database.
+    
+    A duplicate email raises sqlite3.IntegrityError and rolls back the
+    batch that contained it; earlier batches stay committed.
     
-    conn.close()
+    Args:
+        db_path: Path to the database file
+        rows: Iterable of (name, email, company, role, phone) tuples
+        batch_size: Number of rows committed per transaction
+    
+    Returns:
+        Number of participants inserted
+    """
+    return _insert_bulk(db_path, INSERT_PARTICIPANT_SQL, rows, batch_size)
 
 
 def add_moderator(
@@ -206,16 +525,7 @@ def add_moderator(
     expertise: Optional[str] = None
 ):
     """Add a single moderator to the database."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        INSERT INTO moderators (name, city, description, email, phone, expertise)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (name, city, description, email, phone, expertise))
-    
-    conn.commit()
-    conn.close()
+    add_moderators_bulk(db_path, [(name, city, description, email, phone, expertise)])
     print(f"✓ Added moderator: {name}")
 
 
@@ -228,42 +538,42 @@ def add_participant(
     phone: Optional[str] = None
 ):
     """Add a single participant to the database."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    import sqlite3
     
     try:
-        cursor.execute("""
-            INSERT INTO participants (name, email, company, role, phone)
-            VALUES (?, ?, ?, ?, ?)
-        """, (name, email, company, role, phone))
-        
-        conn.commit()
+        add_participants_bulk(db_path, [(name, email, company, role, phone)])
         print(f"✓ Added participant: {name}")
     except sqlite3.IntegrityError:
         print(f"✗ Participant with email {email} already exists!")
-    finally:
-        conn.close()
 
 
 if __name__ == "__main__":
-    import sys
-    
     db_path = "event_planning.db"
     
-    print("="*60)
+    print(_SEP_EQ)
     print("EVENT PLANNING DATABASE SETUP")
-    print("="*60)
+    print(_SEP_EQ)
     
-    # Create database
-    create_database(db_path)
+    # Create database (indexes are built after the optional seed)
+    recreate = True
+    if os.path.exists(db_path):
+        print(f"Database already exists at: {db_path}")
+        response = input("Do you want to recreate it? (yes/no): ").strip().lower()
+        recreate = response == 'yes'
+        if not recreate:
+            print("Keeping existing database.")
+    if recreate:
+        create_database(db_path, include_indexes=False, force=True, verbose=True)
     
     # Ask if user wants to seed sample data
     response = input("\nDo you want to add sample data? (yes/no): ").strip().lower()
     if response == 'yes':
         seed_sample_data(db_path)
+    create_indexes(db_path, verbose=True)
+    if response == 'yes':
         view_database_contents(db_path)
     
-    print("\n" + "="*60)
+    print("\n" + _SEP_EQ)
     print("Setup complete! You can now use the database with your event planning system.")
-    print(f"Database location: {Path(db_path).absolute()}")
-    print("="*60)
\ No newline at end of file
+    print(f"Database location: {os.path.abspath(db_path)}")
+    print(_SEP_EQ)
\ No newline at end of file
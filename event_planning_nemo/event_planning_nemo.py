@@ -4,14 +4,23 @@ This module provides custom functions for event planning with SQLite database in
 """
 
 import re
+import sys
+import atexit
 import asyncio
+import hashlib
+import logging
 import sqlite3
 import os
-from typing import Dict, List, Any, Optional
+import queue
+import threading
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Optional
 from pathlib import Path
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
-from litellm import completion
+from litellm import acompletion, completion
 
 from nat.data_models.function import FunctionBaseConfig
 from nat.cli.register_workflow import register_function
@@ -24,68 +33,612 @@ from nat.data_models.interactive import HumanPromptText,HumanResponseText
 # Load environment variables
 load_dotenv()
 
-
-# Configuration settings
-class Settings:
-    def __init__(self):
-        # NVIDIA NIM Configuration
-        self.nim_base_url = os.getenv("NIM_BASE_URL", "http://localhost:8202")
-        self.nim_api_key = os.getenv("NVIDIA_API_KEY", "")
-        self.model_name = os.getenv("MODEL_NAME", "meta/llama3.1-8b-instruct")
+logger = logging.getLogger(__name__)
+
+# Precompiled patterns for splitting LLM theme responses
+_THEME_SPLIT_RE = re.compile(r"\*\*\d+\.\s*")
+_NORMALIZE_RE = re.compile(r"\n{2,}")
+
+# Prompt templates for event plan refinement, specialized at import time
+# for every (single_day, has_moderators) combination
+_MOD_TMPL = "{name} from {city} with expertise in {desc}"
+
+_AGENDA_HEAD = {
+    True: (
+        "Using the theme: '{theme}', provide a detailed descriptive agenda with timings "
+        "(from {start_time} to {end_time}), location, target audience, and purpose for the event on {start_date}. "
+        "It is a {event_type} event at {location}. "
+    ),
+    False: (
+        "Using the theme: '{theme}', provide a detailed descriptive agenda with timings "
+        "(from {start_time} to {end_time}), location, target audience, and purpose for the event "
+        "from {start_date} to {end_date}. "
+        "It is a {event_type} event at {location}. "
+    ),
+}
+
+_MODERATORS_SENTENCE = {
+    True: "The moderators for this event are: {moderators}. ",
+    False: "No specific moderators provided. ",
+}
+
+_PLAN_TAIL = {
+    True: (
+        "Additionally, draft a professional and concise email invitation content that includes the event title, "
+        "date, time, location, and a brief overview to invite participants."
+    ),
+    False: (
+        "Please make sure to split the agenda across both days ({start_date} and {end_date}), "
+        "showing a balanced distribution of sessions, breaks, and networking events for both days. "
+        "Additionally, draft a professional and concise email invitation content that includes the event title, "
+        "date range, daily timings, location, and a brief overview to invite participants."
+    ),
+}
+
+# Shorter endings used by the standalone EventPlanningWorkflow
+_WORKFLOW_TAIL = {
+    True: "Additionally, draft a professional and concise email invitation content.",
+    False: "Split the agenda across both days. Additionally, draft a professional email invitation.",
+}
+
+_TEMPLATES = {
+    (single_day, has_mods): _AGENDA_HEAD[single_day] + _MODERATORS_SENTENCE[has_mods] + _PLAN_TAIL[single_day]
+    for single_day in (True, False)
+    for has_mods in (True, False)
+}
+
+_WORKFLOW_TEMPLATES = {
+    (single_day, has_mods): _AGENDA_HEAD[single_day] + _MODERATORS_SENTENCE[has_mods] + _WORKFLOW_TAIL[single_day]
+    for single_day in (True, False)
+    for has_mods in (True, False)
+}
+
+
+# Configuration settings, read once at import
+# NVIDIA NIM Configuration
+NIM_BASE_URL = os.getenv("NIM_BASE_URL", "http://localhost:8202")
+NIM_API_KEY = os.getenv("NVIDIA_API_KEY", "")
+MODEL_NAME = os.getenv("MODEL_NAME", "meta/llama3.1-8b-instruct")
+
+# Database Configuration
+DB_PATH = os.getenv("DB_PATH", "event_planning.db")
+
+# Semantic LLM response cache (opt-in, needs numpy + sentence-transformers)
+SEMCACHE_ENABLED = os.getenv("EVENTPLANNER_SEMCACHE", "0") == "1"
+SEMCACHE_DB_PATH = os.getenv("SEMCACHE_DB_PATH", "semantic_cache.db")
+
+
+# ==================== Semantic Response Cache ====================
+
+class SemanticCache:
+    """
+    Cache LLM responses keyed by the embedding of a short key text.
+    
+    Responses are persisted in a local SQLite table and all embeddings are
+    kept in memory as one L2-normalized matrix, so a lookup is a single
+    matrix-vector product. A key whose cosine similarity to a cached key
+    reaches the threshold reuses that key's response.
+    
+    The key must be the part of the prompt that varies (the event idea),
+    not the full prompt: a long fixed template dominates the embedding and
+    pushes unrelated requests over the threshold. With all-MiniLM-L6-v2,
+    unrelated ideas such as "pickle ball event" and "AI conference" score
+    far below 0.95; only near-identical wordings of one idea reach it.
+    
+    Callers embed a key once with embed() and pass the vector to both
+    lookup() and store(), so a miss runs the model a single time.
+    """
+    
+    def __init__(
+        self,
+        db_path: str,
+        threshold: float = 0.95,
+        model_name: str = "all-MiniLM-L6-v2"
+    ):
+        # Optional dependencies, only needed when the cache is enabled
+        import numpy as np
+        from sentence_transformers import SentenceTransformer
+        
+        self._np = np
+        self._model = SentenceTransformer(model_name)
+        self.db_path = db_path
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS semantic_cache (
+                prompt_hash TEXT PRIMARY KEY,
+                embedding BLOB NOT NULL,
+                response TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
         
-        # Database Configuration
-        self.db_path = os.getenv("DB_PATH", "event_planning.db")
+        rows = self._conn.execute(
+            "SELECT prompt_hash, embedding, response FROM semantic_cache"
+        ).fetchall()
+        self._hashes = {row[0] for row in rows}
+        self._responses = [row[2] for row in rows]
+        dim = self._model.get_sentence_embedding_dimension()
+        self._embeddings = np.array(
+            [np.frombuffer(row[1], dtype=np.float32) for row in rows],
+            dtype=np.float32
+        ).reshape(len(rows), dim)
+    
+    def embed(self, text: str):
+        """Return the L2-normalized float32 embedding of text."""
+        return self._model.encode(text, normalize_embeddings=True).astype(self._np.float32)
+    
+    def lookup(self, query) -> Optional[str]:
+        """Return the cached response for a key similar to the embedding query, or None."""
+        with self._lock:
+            if not self._responses:
+                return None
+            scores = self._embeddings @ query
+            best = int(scores.argmax())
+            if scores[best] >= self.threshold:
+                return self._responses[best]
+        return None
+    
+    def store(self, key: str, response: str, vec):
+        """Persist a key/response pair with its embedding vec and add it to the in-memory index."""
+        prompt_hash = hashlib.sha256(key.encode()).hexdigest()
+        with self._lock:
+            if prompt_hash in self._hashes:
+                return
+            self._conn.execute(
+                "INSERT OR IGNORE INTO semantic_cache (prompt_hash, embedding, response) VALUES (?, ?, ?)",
+                (prompt_hash, vec.tobytes(), response)
+            )
+            self._conn.commit()
+            self._hashes.add(prompt_hash)
+            self._responses.append(response)
+            self._embeddings = self._np.vstack([self._embeddings, vec])
+
+
+# Global semantic cache instance (None when disabled)
+semantic_cache = SemanticCache(SEMCACHE_DB_PATH) if SEMCACHE_ENABLED else None
+
+
+# ==================== Exact-Match Prompt Cache ====================
+
+class _LRUCache:
+    """Small thread-safe LRU mapping used by the prompt caches."""
+    
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+    
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+# Validated LLM text keyed by the SHA-256 of the prompt, shared by the
+# sync and async paths
+_prompt_cache = _LRUCache(maxsize=512)
+
+
+def _prompt_key(prompt: str) -> str:
+    """Return the exact-match cache key for a prompt."""
+    return hashlib.sha256(prompt.encode()).hexdigest()
+
+
+def cached_completion(prompt: str) -> str:
+    """
+    Call the LLM with a single user message and return its content,
+    reusing the content for an identical prompt (keyed by SHA-256, least
+    recently used entry evicted).
+    
+    The response is validated before caching, so a malformed response
+    raises ValueError and the next call with that prompt retries the LLM.
+    """
+    key = _prompt_key(prompt)
+    content = _prompt_cache.get(key)
+    if content is not None:
+        return content
+    
+    response = completion(
+        model=MODEL_NAME,
+        messages=[{"content": prompt, "role": "user"}],
+        api_base=NIM_BASE_URL,
+        api_key=NIM_API_KEY
+    )
+    content = _extract_content(response)
+    
+    _prompt_cache.put(key, content)
+    return content
+
+
+async def cached_acompletion(prompt: str) -> str:
+    """
+    Stream the LLM response for a single user message and return its text.
+    
+    Awaiting the stream keeps the event loop free during generation. The
+    assembled text shares cached_completion()'s cache.
+    """
+    key = _prompt_key(prompt)
+    content = _prompt_cache.get(key)
+    if content is not None:
+        return content
+    
+    response_stream = await acompletion(
+        model=MODEL_NAME,
+        messages=[{"content": prompt, "role": "user"}],
+        api_base=NIM_BASE_URL,
+        api_key=NIM_API_KEY,
+        stream=True
+    )
+    if response_stream is None:
+        raise ValueError("LLM returned None response")
+    
+    content = "".join([
+        chunk.choices[0].delta.content or ""
+        async for chunk in response_stream
+        if chunk.choices
+    ])
+    if not content:
+        raise ValueError("LLM response has no content")
+    
+    _prompt_cache.put(key, content)
+    return content
+
+
+# ==================== LLM Helper Functions ====================
+
+def _theme_prompt(event_idea: str) -> str:
+    """Build the theme-generation prompt for an event idea."""
+    return (
+        f"Generate exactly five professional, creative, and distinct event ideas "
+        f"with titles and detailed descriptions based on: '{event_idea}'. "
+        f"Format each theme as a numbered bold title followed by its description"
+    )
+
+
+def _describe_moderators(moderators: List[Dict[str, str]]) -> str:
+    """Join the moderator descriptions used in event plan prompts."""
+    return " ".join(
+        _MOD_TMPL.format(
+            name=moderator['name'],
+            city=moderator['city'],
+            desc=moderator.get('description', 'events')
+        )
+        for moderator in moderators
+    )
+
+
+def _extract_content(response: Any) -> str:
+    """Return the message content of a completion() response, or raise ValueError."""
+    # Safe extraction with proper None checks
+    if response is None:
+        raise ValueError("LLM returned None response")
+    
+    choices = response["choices"] if isinstance(response, dict) else None
+    if not choices or len(choices) == 0:
+        raise ValueError("LLM response has no choices")
+    
+    message = choices[0].get("message")
+    if not message:
+        raise ValueError("LLM response has no message")
+    
+    content = message.get("content")
+    if not content:
+        raise ValueError("LLM response has no content")
+    
+    return content
 
 
-settings = Settings()
+def _cached_lookup(prompt: str, semantic_key: str):
+    """
+    Look prompt up in the exact-match cache, then semantic_key in the
+    semantic cache.
+    
+    Returns (content, vec). content is None on a miss, in which case vec is
+    semantic_key's embedding to pass to semantic_cache.store() once the LLM
+    has answered. A semantic hit is copied into the exact-match cache so
+    the same prompt skips the embedding next time.
+    """
+    key = _prompt_key(prompt)
+    content = _prompt_cache.get(key)
+    if content is not None:
+        return content, None
+    
+    vec = semantic_cache.embed(semantic_key)
+    content = semantic_cache.lookup(vec)
+    if content is not None:
+        _prompt_cache.put(key, content)
+    return content, vec
+
+
+def _call_llm(prompt: str, semantic_key: Optional[str] = None) -> str:
+    """
+    Get the stripped LLM response for prompt, going through the caches.
+    
+    Only calls given a semantic_key (theme generation, keyed by the event
+    idea) consult the semantic cache. Plan prompts share one long template
+    and differ only in dates, times, location and moderators, so a
+    similarity match could return a plan for the wrong event. The
+    exact-match cache is checked first, so an identical prompt never pays
+    for an embedding.
+    """
+    if semantic_key is None or semantic_cache is None:
+        return cached_completion(prompt).strip()
+    
+    content, vec = _cached_lookup(prompt, semantic_key)
+    if content is None:
+        content = cached_completion(prompt)
+        semantic_cache.store(semantic_key, content, vec)
+    return content.strip()
+
+
+async def _acall_llm(prompt: str, semantic_key: Optional[str] = None) -> str:
+    """
+    Async, streaming counterpart of _call_llm.
+    
+    The cache lookup (with its embedding forward pass) and the semantic
+    cache's SQLite writes run in worker threads so they do not block the
+    event loop.
+    """
+    if semantic_key is None or semantic_cache is None:
+        return (await cached_acompletion(prompt)).strip()
+    
+    content, vec = await asyncio.to_thread(_cached_lookup, prompt, semantic_key)
+    if content is None:
+        content = await cached_acompletion(prompt)
+        await asyncio.to_thread(semantic_cache.store, semantic_key, content, vec)
+    return content.strip()
+
+
+def _parse_themes(raw: str) -> List[str]:
+    """Split an LLM theme response into cleaned, non-empty themes."""
+    # Collapse blank lines in one pass over the whole response, then
+    # split themes by numbered format
+    normalized = _NORMALIZE_RE.sub("\n", raw)
+    parts = _THEME_SPLIT_RE.split(normalized)
+    return [part.strip() for part in parts if part.strip()]
 
 
 # ==================== Database Helper Functions ====================
 
+# Rows pulled from SQLite per fetchmany() call when streaming results
+_FETCH_CHUNK_SIZE = 250
+
+# Name lists longer than this are matched through a temp-table JOIN instead
+# of an IN (...) list, keeping the SQL text and bound parameters small
+_IN_LIST_MAX = 100
+
+# Canonical fetch queries; "{placeholders}" is filled per name-list length
+_FETCH_SQL = {
+    "mods_all": """
+        SELECT name,city,description,email,phone,expertise 
+        FROM moderators
+    """,
+    "mods_by_name": """
+        SELECT name,city,description,email,phone,expertise
+        FROM moderators 
+        WHERE name IN ({placeholders})
+    """,
+    "parts_all": """
+        SELECT id,name,email,company,role,phone
+        FROM participants
+    """,
+    "parts_all_limit": """
+        SELECT id,name,email,company,role,phone
+        FROM participants
+        LIMIT ?
+    """,
+    "parts_by_name": """
+        SELECT name,email,company,role,phone
+        FROM participants 
+        WHERE name IN ({placeholders})
+    """,
+    "mods_by_temp_names": """
+        SELECT m.name,m.city,m.description,m.email,m.phone,m.expertise
+        FROM moderators m
+        JOIN _names ON m.name = _names.n
+    """,
+    "parts_by_temp_names": """
+        SELECT p.name,p.email,p.company,p.role,p.phone
+        FROM participants p
+        JOIN _names ON p.name = _names.n
+    """,
+}
+
+
+@lru_cache(maxsize=32)
+def _by_name_sql(key: str, n_names: int) -> str:
+    """
+    Build (once per arity) the IN (...) query for n_names names.
+    
+    Returning the identical string for the same arity also lets sqlite3's
+    per-connection statement cache reuse the prepared statement.
+    """
+    return _FETCH_SQL[key].format(placeholders=",".join("?" * n_names))
+
+
+class SQLiteReadPool:
+    """Fixed-size pool of read-only SQLite connections for concurrent SELECTs."""
+    
+    def __init__(self, db_path: str, size: int = 4):
+        self.db_path = db_path
+        self.size = size
+        self._q: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=size)
+        # Connections are private (no cache=shared): under WAL each reader
+        # keeps its own snapshot and page cache, so readers run in parallel
+        uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+        for _ in range(size):
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            self._q.put(conn)
+    
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection and return it to the pool afterwards."""
+        conn = self._q.get()
+        try:
+            yield conn
+        finally:
+            self._q.put(conn)
+    
+    def close_all(self):
+        """Close every idle connection in the pool."""
+        while True:
+            try:
+                self._q.get_nowait().close()
+            except queue.Empty:
+                break
+
+
 class DatabaseManager:
     """Manage SQLite3 database operations for moderators and participants."""
     
     def __init__(self, db_path: str = ""):
-        self.db_path = db_path or settings.db_path
+        self.db_path = db_path or DB_PATH
+        self._read_pool: Optional[SQLiteReadPool] = None
+        self._read_pool_lock = threading.Lock()
+    
+    def get_read_pool(self) -> SQLiteReadPool:
+        """Return the read-only pool, opening it on first use."""
+        with self._read_pool_lock:
+            if self._read_pool is None:
+                self._bootstrap_indexes()
+                self._read_pool = SQLiteReadPool(self.db_path)
+            return self._read_pool
+    
+    def _bootstrap_indexes(self):
+        """
+        Make sure the name lookups used by the fetch methods are indexed.
+        
+        Runs once, before the read pool is opened, on a short-lived
+        read/write connection that is closed afterwards. The index names
+        match db_setup.create_indexes, so a database created there needs no
+        extra work. A missing database or table is left for the fetch
+        methods to report.
+        """
+        if not os.path.exists(self.db_path):
+            return
+        try:
+            with closing(sqlite3.connect(self.db_path)) as conn:
+                conn.executescript("""
+                    CREATE INDEX IF NOT EXISTS idx_moderators_name ON moderators(name);
+                    CREATE INDEX IF NOT EXISTS idx_participants_name ON participants(name);
+                """)
+        except sqlite3.OperationalError as e:
+            print(f"Database warning creating indexes: {e}")
+    
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Create and return a read/write database connection.
+        
+        The caller owns the connection and must close it. The fetch methods
+        read through the pool instead.
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
+    
+    def close_all(self):
+        """Close the read pool opened by this manager."""
+        with self._read_pool_lock:
+            if self._read_pool is not None:
+                self._read_pool.close_all()
+                self._read_pool = None
+    
+    @staticmethod
+    def _iter_rows(cursor: sqlite3.Cursor) -> Iterator[Dict[str, Any]]:
+        """Yield the cursor's rows as dicts, fetching _FETCH_CHUNK_SIZE at a time."""
+        # Plain tuples zipped with one shared key tuple avoid building
+        # an intermediate sqlite3.Row per result
+        cols = tuple(c[0] for c in cursor.description)
+        while True:
+            rows = cursor.fetchmany(_FETCH_CHUNK_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(cols, row))
+    
+    @staticmethod
+    def _load_temp_names(conn: sqlite3.Connection, names: List[str]):
+        """Fill the connection's temp _names table with the given names."""
+        # TEMP tables are private to the connection and writable even on a
+        # read-only handle; commit so no read snapshot is held open
+        with conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS _names(n TEXT PRIMARY KEY)")
+            conn.execute("DELETE FROM _names")
+            conn.executemany("INSERT OR IGNORE INTO _names VALUES (?)", [(n,) for n in names])
     
-    def get_connection(self):
-        """Create and return a database connection."""
-        return sqlite3.connect(self.db_path)
+    def _iter_moderators(
+        self,
+        moderator_names: Optional[List[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream moderators from the database without materializing them all."""
+        with self.get_read_pool().acquire() as conn:
+            cursor = conn.cursor()
+            
+            if moderator_names and len(moderator_names) > _IN_LIST_MAX:
+                self._load_temp_names(conn, moderator_names)
+                cursor.execute(_FETCH_SQL["mods_by_temp_names"])
+            elif moderator_names:
+                query = _by_name_sql("mods_by_name", len(moderator_names))
+                cursor.execute(query, moderator_names)
+            else:
+                cursor.execute(_FETCH_SQL["mods_all"])
+            
+            yield from self._iter_rows(cursor)
+    
+    def _iter_participants(
+        self,
+        participant_names: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream participants from the database without materializing them all."""
+        with self.get_read_pool().acquire() as conn:
+            cursor = conn.cursor()
+            
+            if participant_names and len(participant_names) > _IN_LIST_MAX:
+                self._load_temp_names(conn, participant_names)
+                query = _FETCH_SQL["parts_by_temp_names"]
+                params = []
+            elif participant_names:
+                query = _by_name_sql("parts_by_name", len(participant_names))
+                params = participant_names
+            elif limit:
+                query = _FETCH_SQL["parts_all_limit"]
+                params = [limit]
+            else:
+                query = _FETCH_SQL["parts_all"]
+                params = []
+            
+            cursor.execute(query, params)
+            yield from self._iter_rows(cursor)
     
     def fetch_moderators_from_db(
         self, 
         moderator_names: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Fetch moderators from the database."""
-        conn = self.get_connection()
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         try:
-            if moderator_names:
-                placeholders = ','.join('?' * len(moderator_names))
-                query = f"""
-                    SELECT name,city,description,email,phone,expertise
-                    FROM moderators 
-                    WHERE name IN ({placeholders})
-                """
-                cursor.execute(query, moderator_names)
-            else:
-                query = """
-                    SELECT name,city,description,email,phone,expertise 
-                    FROM moderators
-                """
-                cursor.execute(query)
-            
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            return list(self._iter_moderators(moderator_names))
         
         except sqlite3.Error as e:
             print(f"Database error fetching moderators: {e}")
             return []
-        
-        finally:
-            conn.close()
     
     def fetch_participants_from_db(
         self,
@@ -93,44 +646,18 @@ class DatabaseManager:
         limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Fetch participants from the database."""
-        conn = self.get_connection()
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         try:
-            if participant_names:
-                placeholders = ','.join('?' * len(participant_names))
-                query = f"""
-                    SELECT name,email,company,role,phone
-                    FROM participants 
-                    WHERE name IN ({placeholders})
-                """
-                params = participant_names
-            else:
-                query = """
-                    SELECT id,name,email,company,role,phone
-                    FROM participants
-                """
-                params = []
-                
-                if limit:
-                    query += " LIMIT ?"
-                    params.append(limit)
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            return list(self._iter_participants(participant_names, limit))
         
         except sqlite3.Error as e:
             print(f"Database error fetching participants: {e}")
             return []
-        
-        finally:
-            conn.close()
 
 
-# Global database manager instance
+# Global database manager instance, closed at interpreter exit; other
+# instances are closed by their owners via close_all()
 db_manager = DatabaseManager()
+atexit.register(db_manager.close_all)
 
 
 # ==================== Input/Output Schema Classes ====================
@@ -282,43 +809,10 @@ async def generate_event_themes(
     
     async def _generate_themes(input_data: EventIdeaInput) -> ThemesOutput:
         """Inner function that does the actual theme generation."""
-        prompt = (
-            f"Generate exactly five professional, creative, and distinct event ideas "
-            f"with titles and detailed descriptions based on: '{input_data.event_idea}'. "
-            f"Format each theme as a numbered bold title followed by its description"
-        )
+        prompt = _theme_prompt(input_data.event_idea)
         
         try:
-            response = completion(
-                model=settings.model_name,
-                messages=[{"content": prompt, "role": "user"}],
-                api_base=settings.nim_base_url,
-                api_key=settings.nim_api_key
-            )
-            
-            # Safe extraction with proper None checks
-            if response is None:
-                raise ValueError("LLM returned None response")
-            
-            choices = response["choices"] if isinstance(response, dict) else None
-            if not choices or len(choices) == 0:
-                raise ValueError("LLM response has no choices")
-            
-            message = choices[0].get("message")
-            if not message:
-                raise ValueError("LLM response has no message")
-            
-            content = message.get("content")
-            if not content:
-                raise ValueError("LLM response has no content")
-            
-            raw_response = content.strip()
-            
-            # Split themes by numbered format
-            themes = re.split(r"\*\*\d+\.\s*", raw_response)
-            if themes and not themes[0].strip():
-                themes.pop(0)
-            cleaned_themes = [theme.replace("\n\n", "\n").strip() for theme in themes if theme]
+            cleaned_themes = _parse_themes(await _acall_llm(prompt, semantic_key=input_data.event_idea))
             
             if not cleaned_themes:
                 raise ValueError("Failed to extract themes from LLM response")
@@ -356,61 +850,21 @@ async def refine_event_plan(
     
     async def _refine_plan(input_data: EventPlanInput) -> EventPlanOutput:
         """Inner function that does the actual plan refinement."""
-        # Format moderator information
-        moderator_descriptions = " ".join([
-            f"{moderator['name']} from {moderator['city']} with expertise in {moderator.get('description', 'events')}"
-            for moderator in input_data.moderators
-        ])
-        moderators_str = f"The moderators for this event are: {moderator_descriptions}." if input_data.moderators else "No specific moderators provided."
-        
-        # Build prompt based on single or multi-day event
-        if input_data.start_date == input_data.end_date:
-            prompt = (
-                f"Using the theme: '{input_data.selected_theme}', provide a detailed descriptive agenda with timings "
-                f"(from {input_data.start_time} to {input_data.end_time}), location, target audience, and purpose for the event on {input_data.start_date}. "
-                f"It is a {input_data.event_type} event at {input_data.location}. "
-                f"{moderators_str} "
-                f"Additionally, draft a professional and concise email invitation content that includes the event title, "
-                f"date, time, location, and a brief overview to invite participants."
-            )
-        else:
-            prompt = (
-                f"Using the theme: '{input_data.selected_theme}', provide a detailed descriptive agenda with timings "
-                f"(from {input_data.start_time} to {input_data.end_time}), location, target audience, and purpose for the event "
-                f"from {input_data.start_date} to {input_data.end_date}. "
-                f"It is a {input_data.event_type} event at {input_data.location}. "
-                f"{moderators_str} "
-                f"Please make sure to split the agenda across both days ({input_data.start_date} and {input_data.end_date}), "
-                f"showing a balanced distribution of sessions, breaks, and networking events for both days. "
-                f"Additionally, draft a professional and concise email invitation content that includes the event title, "
-                f"date range, daily timings, location, and a brief overview to invite participants."
-            )
+        # Pick the template for single/multi-day and with/without moderators
+        key = (input_data.start_date == input_data.end_date, bool(input_data.moderators))
+        prompt = _TEMPLATES[key].format(
+            theme=input_data.selected_theme,
+            start_time=input_data.start_time,
+            end_time=input_data.end_time,
+            start_date=input_data.start_date,
+            end_date=input_data.end_date,
+            event_type=input_data.event_type,
+            location=input_data.location,
+            moderators=_describe_moderators(input_data.moderators)
+        )
         
         try:
-            response = completion(
-                model=settings.model_name,
-                messages=[{"content": prompt, "role": "user"}],
-                api_base=settings.nim_base_url,
-                api_key=settings.nim_api_key
-            )
-            
-            # Safe extraction with proper None checks
-            if response is None:
-                raise ValueError("LLM returned None response")
-            
-            choices = response["choices"] if isinstance(response, dict) else None
-            if not choices or len(choices) == 0:
-                raise ValueError("LLM response has no choices")
-            
-            message = choices[0].get("message")
-            if not message:
-                raise ValueError("LLM response has no message")
-            
-            content = message.get("content")
-            if not content:
-                raise ValueError("LLM response has no content")
-            
-            refined_plan = content.strip()
+            refined_plan = await _acall_llm(prompt)
             
             return EventPlanOutput(refined_plan=refined_plan)
             
@@ -429,11 +883,11 @@ async def refine_event_plan(
 Unable to generate event plan due to: {str(e)}
 
 ## Troubleshooting
-1. Verify NIM_BASE_URL is set correctly: {settings.nim_base_url}
+1. Verify NIM_BASE_URL is set correctly: {NIM_BASE_URL}
 2. Check NVIDIA_API_KEY is valid
 3. Ensure NVIDIA NIM endpoint is running and accessible
 4. Check network connectivity
-5. Verify model name: {settings.model_name}
+5. Verify model name: {MODEL_NAME}
 
 Please check your configuration and try again.
 """
@@ -459,7 +913,11 @@ async def fetch_moderators(
     
     async def _fetch_moderators(input_data: ModeratorsInput) -> ModeratorsOutput:
         """Inner function that fetches moderators from database."""
-        moderators = db_manager.fetch_moderators_from_db(input_data.moderator_names)
+        # Run the blocking SQLite query in a worker thread to keep the event loop free
+        moderators = await asyncio.to_thread(
+            db_manager.fetch_moderators_from_db,
+            input_data.moderator_names
+        )
         return ModeratorsOutput(moderators=moderators)
     
     # Yield FunctionInfo to register the function with NeMo Agent Toolkit
@@ -482,7 +940,9 @@ async def fetch_participants(
     
     async def _fetch_participants(input_data: ParticipantsInput) -> ParticipantsOutput:
         """Inner function that fetches participants from database."""
-        participants = db_manager.fetch_participants_from_db(
+        # Run the blocking SQLite query in a worker thread to keep the event loop free
+        participants = await asyncio.to_thread(
+            db_manager.fetch_participants_from_db,
             participant_names=input_data.participant_names,
             limit=input_data.limit
         )
@@ -502,43 +962,10 @@ class EventPlanningWorkflow:
     
     def generate_event_themes(self, event_idea: str) -> List[str]:
         """Generate event themes synchronously."""
-        prompt = (
-            f"Generate exactly five professional, creative, and distinct event ideas "
-            f"with titles and detailed descriptions based on: '{event_idea}'. "
-            f"Format each theme as a numbered bold title followed by its description"
-        )
+        prompt = _theme_prompt(event_idea)
         
         try:
-            response = completion(
-                model=settings.model_name,
-                messages=[{"content": prompt, "role": "user"}],
-                api_base=settings.nim_base_url,
-                api_key=settings.nim_api_key
-            )
-            
-            # Safe extraction with proper None checks
-            if response is None:
-                raise ValueError("LLM returned None response")
-            
-            choices = response["choices"] if isinstance(response, dict) else None
-            if not choices or len(choices) == 0:
-                raise ValueError("LLM response has no choices")
-            
-            message = choices[0].get("message")
-            if not message:
-                raise ValueError("LLM response has no message")
-            
-            content = message.get("content")
-            if not content:
-                raise ValueError("LLM response has no content")
-            
-            raw_response = content.strip()
-            
-            # Split themes by numbered format
-            themes = re.split(r"\*\*\d+\.\s*", raw_response)
-            if themes and not themes[0].strip():
-                themes.pop(0)
-            cleaned_themes = [theme.replace("\n\n", "\n").strip() for theme in themes if theme]
+            cleaned_themes = _parse_themes(_call_llm(prompt, semantic_key=event_idea))
             
             return cleaned_themes if cleaned_themes else ["Error: Unable to generate themes"]
             
@@ -554,92 +981,52 @@ class EventPlanningWorkflow:
         participants: Optional[List[Dict[str, str]]] = None
     ) -> str:
         """Complete event planning workflow."""
-        moderator_descriptions = " ".join([
-            f"{moderator['name']} from {moderator['city']} with expertise in {moderator.get('description', 'events')}"
-            for moderator in moderators
-        ])
-        moderators_str = f"The moderators for this event are: {moderator_descriptions}." if moderators else "No specific moderators provided."
-        
-        if event_details["start_date"] == event_details["end_date"]:
-            prompt = (
-                f"Using the theme: '{selected_theme}', provide a detailed descriptive agenda with timings "
-                f"(from {event_details['start_time']} to {event_details['end_time']}), location, target audience, and purpose for the event on {event_details['start_date']}. "
-                f"It is a {event_details['event_type']} event at {event_details['location']}. "
-                f"{moderators_str} "
-                f"Additionally, draft a professional and concise email invitation content."
-            )
-        else:
-            prompt = (
-                f"Using the theme: '{selected_theme}', provide a detailed descriptive agenda with timings "
-                f"(from {event_details['start_time']} to {event_details['end_time']}), location, target audience, and purpose for the event "
-                f"from {event_details['start_date']} to {event_details['end_date']}. "
-                f"It is a {event_details['event_type']} event at {event_details['location']}. "
-                f"{moderators_str} "
-                f"Split the agenda across both days. Additionally, draft a professional email invitation."
-            )
+        key = (event_details["start_date"] == event_details["end_date"], bool(moderators))
+        prompt = _WORKFLOW_TEMPLATES[key].format(
+            theme=selected_theme,
+            start_time=event_details['start_time'],
+            end_time=event_details['end_time'],
+            start_date=event_details['start_date'],
+            end_date=event_details['end_date'],
+            event_type=event_details['event_type'],
+            location=event_details['location'],
+            moderators=_describe_moderators(moderators)
+        )
         
         try:
-            response = completion(
-                model=settings.model_name,
-                messages=[{"content": prompt, "role": "user"}],
-                api_base=settings.nim_base_url,
-                api_key=settings.nim_api_key
-            )
-            
-            # Safe extraction with proper None checks
-            if response is None:
-                raise ValueError("LLM returned None response")
-            
-            choices = response["choices"] if isinstance(response, dict) else None
-            if not choices or len(choices) == 0:
-                raise ValueError("LLM response has no choices")
-            
-            message = choices[0].get("message")
-            if not message:
-                raise ValueError("LLM response has no message")
-            
-            content = message.get("content")
-            if not content:
-                raise ValueError("LLM response has no content")
-            
-            plan = content.strip()
+            plan = _call_llm(prompt)
             
         except Exception as e:
-            print(f"Error generating event plan: {e}")
+            logger.error("Error generating event plan: %s", e)
             plan = f"Error generating plan: {str(e)}\nPlease check your LLM configuration."
         
-        print("\n" + "="*60)
-        print("REFINED EVENT PLAN")
-        print("="*60)
-        print(plan)
-        print("="*60 + "\n")
+        # %-style arguments are only rendered when INFO is enabled
+        separator = "=" * 60
+        logger.info("\n%s\nREFINED EVENT PLAN\n%s\n%s\n%s\n", separator, separator, plan, separator)
         
-        if participants:
-            print("="*60)
-            print("EVENT PARTICIPANTS")
-            print("="*60)
+        if participants and logger.isEnabledFor(logging.INFO):
+            logger.info("%s\nEVENT PARTICIPANTS\n%s", separator, separator)
             for p in participants:
-                print(f"- {p.get('name', 'Unknown')} ({p.get('email', 'N/A')})")
-            print("="*60 + "\n")
+                logger.info("- %s (%s)", p.get('name', 'Unknown'), p.get('email', 'N/A'))
+            logger.info("%s\n", separator)
         
         return plan
 
 
-if __name__ == "__main__":
-    # Example: Direct Python usage (without NeMo CLI)
+async def main():
+    """Example: Direct Python usage (without NeMo CLI)."""
     planner = EventPlanningWorkflow()
     
-    # Generate themes
-    print("Generating themes...")
-    themes = planner.generate_event_themes("pickle ball event")
+    # Theme generation and both database fetches are independent, so run
+    # them concurrently in worker threads
+    print("Generating themes and fetching moderators/participants...")
+    themes, moderators, participants = await asyncio.gather(
+        asyncio.to_thread(planner.generate_event_themes, "pickle ball event"),
+        asyncio.to_thread(db_manager.fetch_moderators_from_db),
+        asyncio.to_thread(db_manager.fetch_participants_from_db, limit=10)
+    )
     print(f"Generated {len(themes)} themes\n")
-    
-    # Fetch moderators from database
-    moderators = db_manager.fetch_moderators_from_db()
     print(f"Found {len(moderators)} moderators in database")
-    
-    # Fetch participants from database
-    participants = db_manager.fetch_participants_from_db(limit=10)
     print(f"Found {len(participants)} participants in database\n")
     
     # Create event plan
@@ -662,4 +1049,9 @@ if __name__ == "__main__":
         
         print("\n✅ Event planning completed successfully!")
     else:
-        print("\n⚠️  No themes or moderators found. Please check your database.")
\ No newline at end of file
+        print("\n⚠️  No themes or moderators found. Please check your database.")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    asyncio.run(main())
@@ -1,6 +1,10 @@
 import requests
 
-resp = requests.post(
+# Reuse one keep-alive connection across requests instead of a new
+# TCP (and TLS) handshake per call
+_SESSION = requests.Session()
+
+resp = _SESSION.post(
     "http://localhost:8202/v1/chat/completions",
     headers={
         "Content-Type": "application/json",